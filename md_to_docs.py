@@ -2,6 +2,8 @@
 """
 Markdown to Documentation HTML Converter
 Run like: python md_to_docs.py TUTORIAL.md -o docs.html --title "LIPID+ - Documentation"
+Only the standard library is used, so it also runs unchanged under PyPy:
+pypy3 md_to_docs.py TUTORIAL.md -o docs.html
 
 Converts a markdown file to a documentation HTML page with:
 - Left sidebar navigation (Level 1 headings as main items)
@@ -11,439 +13,55 @@ Converts a markdown file to a documentation HTML page with:
 - Mobile responsive design
 """
 
+import os
 import re
-import argparse
+import functools
+import hashlib
+import sys
+import time
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterator, Optional, TextIO
 import html
 
 
-@dataclass
-class Section:
-    """Represents a documentation section"""
-    id: str
-    title: str
-    level: int
-    content: str = ""
-    children: list = field(default_factory=list)
-    parent_id: Optional[str] = None
+# Code fences and h1/h2 lines, matched in a single pass over the document.
+# Matching the newline before each line (instead of ^) gives the regex engine
+# a literal to jump between, rather than trying the pattern at every offset.
+_RE_SECTION_SPLIT = re.compile(
+    r'\n(?:(?P<fence>[^\S\n]*```)'
+    r'|#[^\S\n]+(?P<h1>.+)$'
+    r'|##[^\S\n]+(?P<h2>.+)$)',
+    re.MULTILINE
+)
 
+# Markdown constructs handled by convert_markdown_to_html
+_CODE_PLACEHOLDER = '___CODE_'
+_HEADING_TEMPLATES = {
+    3: '<h3 class="text-xl font-semibold mt-6 mb-3 dark:text-white">{}</h3>',
+    4: '<h4 class="text-lg font-semibold mt-6 mb-3 dark:text-white">{}</h4>',
+}
+_LINK_TEMPLATE = '<a href="{}" class="text-purple-600 hover:text-purple-800 dark:text-purple-400 dark:hover:text-purple-300">{}</a>'
+_PASSTHROUGH_FIRST_CHARS = frozenset('<_-')
+_TABLE_CLOSE = '</tbody>\n</table>\n</div>'
+_RE_UL_ITEM = re.compile(r'^(\s*)[-*]\s+(.+)$')
+_RE_OL_ITEM = re.compile(r'^(\s*)\d+\.\s+(.+)$')
 
-class MarkdownToDocsConverter:
-    def __init__(self, title: str = "Documentation", logo_path: str = "images/logo.svg",
-                 css_path: str = "css/style.css", github_url: str = "#"):
-        self.title = title
-        self.logo_path = logo_path
-        self.css_path = css_path
-        self.github_url = github_url
-        self.sections: list[Section] = []
-        
-    def slugify(self, text: str) -> str:
-        """Convert text to URL-friendly slug"""
-        text = text.lower().strip()
-        text = re.sub(r'[^\w\s-]', '', text)
-        text = re.sub(r'[-\s]+', '-', text)
-        return text
-    
-    def parse_markdown(self, md_content: str) -> list[Section]:
-        """Parse markdown content into sections"""
-        lines = md_content.split('\n')
-        sections = []
-        current_h1: Optional[Section] = None
-        current_section: Optional[Section] = None
-        content_buffer = []
-        in_code_block = False
-        
-        def save_content():
-            nonlocal content_buffer, current_section
-            if current_section and content_buffer:
-                current_section.content = '\n'.join(content_buffer)
-                content_buffer = []
-        
-        for line in lines:
-            # Track code blocks to avoid matching # inside them
-            if line.strip().startswith('```'):
-                in_code_block = not in_code_block
-                if current_section:
-                    content_buffer.append(line)
-                continue
-            
-            # Skip heading detection inside code blocks
-            if in_code_block:
-                if current_section:
-                    content_buffer.append(line)
-                continue
-            
-            # Check for Level 1 heading (must be at start of line)
-            h1_match = re.match(r'^#\s+(.+)$', line)
-            if h1_match:
-                save_content()
-                title = h1_match.group(1).strip()
-                section_id = f"page-{self.slugify(title)}"
-                current_h1 = Section(id=section_id, title=title, level=1)
-                current_section = current_h1
-                sections.append(current_h1)
-                continue
-            
-            # Check for Level 2 heading
-            h2_match = re.match(r'^##\s+(.+)$', line)
-            if h2_match and current_h1:
-                save_content()
-                title = h2_match.group(1).strip()
-                section_id = f"page-{self.slugify(current_h1.title)}-{self.slugify(title)}"
-                h2_section = Section(
-                    id=section_id, 
-                    title=title, 
-                    level=2, 
-                    parent_id=current_h1.id
-                )
-                current_h1.children.append(h2_section)
-                current_section = h2_section
-                continue
-            
-            # Accumulate content
-            if current_section:
-                content_buffer.append(line)
-        
-        # Save remaining content
-        save_content()
-        
-        self.sections = sections
-        return sections
-    
-    def convert_markdown_to_html(self, md_content: str) -> str:
-        """Convert markdown content to HTML"""
-        html_content = md_content
-        
-        # Escape HTML special characters in text (but not in code blocks)
-        # We'll handle code blocks separately
-        
-        # Convert code blocks first (preserve them)
-        code_blocks = []
-        def save_code_block(match):
-            code_blocks.append(match.group(0))
-            return f"___CODE_BLOCK_{len(code_blocks)-1}___"
-        
-        # Triple backtick code blocks
-        html_content = re.sub(
-            r'```(\w*)\n(.*?)```',
-            save_code_block,
-            html_content,
-            flags=re.DOTALL
-        )
-        
-        # Inline code
-        inline_codes = []
-        def save_inline_code(match):
-            inline_codes.append(match.group(1))
-            return f"___INLINE_CODE_{len(inline_codes)-1}___"
-        
-        html_content = re.sub(r'`([^`]+)`', save_inline_code, html_content)
-        
-        # Convert headings (h3, h4 - h1 and h2 are handled as sections)
-        html_content = re.sub(
-            r'^####\s+(.+)$',
-            r'<h4 class="text-lg font-semibold mt-6 mb-3 dark:text-white">\1</h4>',
-            html_content,
-            flags=re.MULTILINE
-        )
-        html_content = re.sub(
-            r'^###\s+(.+)$',
-            r'<h3 class="text-xl font-semibold mt-6 mb-3 dark:text-white">\1</h3>',
-            html_content,
-            flags=re.MULTILINE
-        )
-        
-        # Convert horizontal rules
-        html_content = re.sub(r'^---+$', '<hr />', html_content, flags=re.MULTILINE)
-        
-        # Convert bold
-        html_content = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html_content)
-        
-        # Convert italic
-        html_content = re.sub(r'\*(.+?)\*', r'<em>\1</em>', html_content)
-        
-        # Convert links
-        html_content = re.sub(
-            r'\[([^\]]+)\]\(([^)]+)\)',
-            r'<a href="\2" class="text-purple-600 hover:text-purple-800 dark:text-purple-400 dark:hover:text-purple-300">\1</a>',
-            html_content
-        )
-        
-        # Convert tables
-        html_content = self._convert_tables(html_content)
-        
-        # Convert unordered lists
-        html_content = self._convert_lists(html_content)
-        
-        # Convert paragraphs (non-empty lines that aren't already HTML)
-        lines = html_content.split('\n')
-        result_lines = []
-        in_list = False
-        in_pre = False
-        
-        for line in lines:
-            stripped = line.strip()
-            
-            # Skip empty lines
-            if not stripped:
-                if in_list:
-                    in_list = False
-                result_lines.append('')
-                continue
-            
-            # Skip lines that are already HTML tags or special markers
-            if (stripped.startswith('<') or 
-                stripped.startswith('___') or
-                stripped.startswith('|') or
-                stripped.startswith('-') and len(stripped) > 1 and stripped[1] == ' '):
-                result_lines.append(line)
-                continue
-            
-            # Wrap plain text in paragraph tags
-            if not stripped.startswith('<'):
-                result_lines.append(f'<p class="text-lg text-gray-700 leading-relaxed mb-4 dark:text-gray-300">{stripped}</p>')
-            else:
-                result_lines.append(line)
-        
-        html_content = '\n'.join(result_lines)
-        
-        # Restore code blocks with styling
-        for i, code_block in enumerate(code_blocks):
-            match = re.match(r'```(\w*)\n(.*?)```', code_block, re.DOTALL)
-            if match:
-                lang = match.group(1) or 'text'
-                code = html.escape(match.group(2).strip())
-                styled_block = f'''<pre data-language="{lang}">
-<code class="language-{lang}">{code}</code>
-</pre>'''
-                html_content = html_content.replace(f"___CODE_BLOCK_{i}___", styled_block)
-        
-        # Restore inline code with styling
-        for i, code in enumerate(inline_codes):
-            escaped_code = html.escape(code)
-            styled_code = f'<code>{escaped_code}</code>'
-            html_content = html_content.replace(f"___INLINE_CODE_{i}___", styled_code)
-        
-        return html_content
-    
-    def _convert_tables(self, content: str) -> str:
-        """Convert markdown tables to HTML tables"""
-        lines = content.split('\n')
-        result = []
-        table_lines = []
-        in_table = False
-        
-        for line in lines:
-            if '|' in line and line.strip().startswith('|'):
-                in_table = True
-                table_lines.append(line)
-            else:
-                if in_table:
-                    # Process the table
-                    result.append(self._process_table(table_lines))
-                    table_lines = []
-                    in_table = False
-                result.append(line)
-        
-        # Handle table at end of content
-        if table_lines:
-            result.append(self._process_table(table_lines))
-        
-        return '\n'.join(result)
-    
-    def _process_table(self, lines: list[str]) -> str:
-        """Process markdown table lines into HTML table"""
-        if len(lines) < 2:
-            return '\n'.join(lines)
-        
-        html_table = ['<div class="overflow-x-auto mb-6">']
-        html_table.append('<table class="min-w-full divide-y divide-gray-200 dark:divide-gray-700">')
-        
-        for i, line in enumerate(lines):
-            # Skip separator line (------|----)
-            if re.match(r'^\|[\s\-:|]+\|$', line.strip()):
-                continue
-            
-            cells = [cell.strip() for cell in line.strip('|').split('|')]
-            
-            if i == 0:
-                # Header row
-                html_table.append('<thead class="bg-gray-50 dark:bg-gray-800">')
-                html_table.append('<tr>')
-                for cell in cells:
-                    html_table.append(f'<th class="px-4 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider dark:text-gray-400">{cell}</th>')
-                html_table.append('</tr>')
-                html_table.append('</thead>')
-                html_table.append('<tbody class="bg-white divide-y divide-gray-200 dark:bg-gray-900 dark:divide-gray-700">')
-            else:
-                # Data row
-                html_table.append('<tr>')
-                for cell in cells:
-                    html_table.append(f'<td class="px-4 py-3 text-sm text-gray-700 dark:text-gray-300">{cell}</td>')
-                html_table.append('</tr>')
-        
-        html_table.append('</tbody>')
-        html_table.append('</table>')
-        html_table.append('</div>')
-        
-        return '\n'.join(html_table)
-    
-    def _convert_lists(self, content: str) -> str:
-        """Convert markdown lists to HTML lists"""
-        lines = content.split('\n')
-        result = []
-        list_items = []
-        list_type = None  # 'ul' or 'ol'
-        indent_level = 0
-        
-        for line in lines:
-            # Check for unordered list item
-            ul_match = re.match(r'^(\s*)[-*]\s+(.+)$', line)
-            # Check for ordered list item
-            ol_match = re.match(r'^(\s*)\d+\.\s+(.+)$', line)
-            
-            if ul_match:
-                if list_type != 'ul' and list_items:
-                    result.append(self._create_list(list_items, list_type))
-                    list_items = []
-                list_type = 'ul'
-                list_items.append(ul_match.group(2))
-            elif ol_match:
-                if list_type != 'ol' and list_items:
-                    result.append(self._create_list(list_items, list_type))
-                    list_items = []
-                list_type = 'ol'
-                list_items.append(ol_match.group(2))
-            else:
-                if list_items:
-                    result.append(self._create_list(list_items, list_type))
-                    list_items = []
-                    list_type = None
-                result.append(line)
-        
-        # Handle remaining list items
-        if list_items:
-            result.append(self._create_list(list_items, list_type))
-        
-        return '\n'.join(result)
-    
-    def _create_list(self, items: list[str], list_type: str) -> str:
-        """Create HTML list from items"""
-        tag = list_type or 'ul'
-        list_class = "list-disc" if tag == 'ul' else "list-decimal"
-        html_list = [f'<{tag} class="{list_class} list-inside space-y-2 mb-4 text-gray-700 dark:text-gray-300">']
-        for item in items:
-            html_list.append(f'<li>{item}</li>')
-        html_list.append(f'</{tag}>')
-        return '\n'.join(html_list)
-    
-    def generate_sidebar_nav(self) -> str:
-        """Generate sidebar navigation HTML"""
-        nav_items = []
-        
-        for section in self.sections:
-            if section.children:
-                # Section with subsections - create collapsible menu
-                submenu_id = f"submenu-{self.slugify(section.title)}"
-                nav_items.append(f'''
-                            <!-- Collapsible {section.title} Menu -->
-                            <div>
-                                <button onclick="toggleSidebarMenu('{submenu_id}', this)" class="sidebar-link group w-full flex items-center justify-between px-3 py-2 text-base font-medium rounded-md text-gray-700 hover:text-gray-900 hover:bg-gray-100 dark:text-gray-300 dark:hover:bg-gray-700 dark:hover:text-white" aria-expanded="false">
-                                    <span>{section.title}</span>
-                                    <svg class="submenu-chevron w-5 h-5 transform transition-transform duration-200" fill="currentColor" viewBox="0 0 20 20" xmlns="http://www.w3.org/2000/svg"><path fill-rule="evenodd" d="M5.293 7.293a1 1 0 011.414 0L10 10.586l3.293-3.293a1 1 0 111.414 1.414l-4 4a1 1 0 01-1.414 0l-4-4a1 1 0 010-1.414z" clip-rule="evenodd"></path></svg>
-                                </button>
-                                <div id="{submenu_id}" class="hidden mt-1 space-y-1 pl-4 border-l-2 border-gray-200 ml-3 dark:border-gray-600">''')
-                
-                for child in section.children:
-                    nav_items.append(f'''
-                                    <a href="#" class="sidebar-link group flex items-center px-3 py-2 text-sm font-medium rounded-md text-gray-600 hover:text-gray-900 hover:bg-gray-100 dark:text-gray-400 dark:hover:bg-gray-700 dark:hover:text-white" data-page-id="{child.id}" onclick="showPage('{child.id}', 'nav-docs', this)">
-                                        {child.title}
-                                    </a>''')
-                
-                nav_items.append('''
-                                </div>
-                            </div>''')
-            else:
-                # Simple section without subsections
-                nav_items.append(f'''
-                            <a href="#" class="sidebar-link group flex items-center px-3 py-2 text-base font-medium rounded-md text-gray-700 hover:text-gray-900 hover:bg-gray-100 dark:text-gray-300 dark:hover:bg-gray-700 dark:hover:text-white" data-page-id="{section.id}" onclick="showPage('{section.id}', 'nav-docs', this)">
-                                {section.title}
-                            </a>''')
-        
-        return '\n'.join(nav_items)
-    
-    def generate_dropdown_items(self) -> str:
-        """Generate dropdown menu items for top navigation"""
-        items = []
-        for section in self.sections:
-            items.append(f'''                    <a href="#" class="block px-4 py-2 text-sm text-gray-700 hover:bg-gray-100 dark:text-gray-300 dark:hover:bg-gray-700" onclick="showPage('{section.id}', 'nav-docs', this)" data-page-id="{section.id}">{section.title}</a>''')
-        return '\n'.join(items)
-    
-    def generate_content_sections(self) -> str:
-        """Generate content sections HTML"""
-        sections_html = []
-        
-        for section in self.sections:
-            # Convert section content
-            content_html = self.convert_markdown_to_html(section.content)
-            
-            section_html = f'''
-                <!-- Page: {section.title} -->
-                <section id="{section.id}" class="page-content hidden">
-                    <h1 class="text-4xl font-bold mb-6 pb-2 border-b border-gray-200 text-gray-900 dark:text-white dark:border-gray-700">{section.title}</h1>
-                    {content_html}'''
-            
-            # Add child sections
-            for child in section.children:
-                child_content_html = self.convert_markdown_to_html(child.content)
-                section_html += f'''
-                    
-                    <section id="{child.id}-content" class="mt-10">
-                        <h2 class="text-2xl font-semibold mt-8 mb-4 dark:text-white">{child.title}</h2>
-                        {child_content_html}
-                    </section>'''
-            
-            section_html += '''
-                </section>'''
-            
-            sections_html.append(section_html)
-            
-            # Also create separate pages for child sections if they should be standalone
-            for child in section.children:
-                child_content_html = self.convert_markdown_to_html(child.content)
-                child_section = f'''
-                <!-- Page: {child.title} -->
-                <section id="{child.id}" class="page-content hidden">
-                    <h1 class="text-4xl font-bold mb-6 pb-2 border-b border-gray-200 text-gray-900 dark:text-white dark:border-gray-700">{child.title}</h1>
-                    {child_content_html}
-                </section>'''
-                sections_html.append(child_section)
-        
-        return '\n'.join(sections_html)
-    
-    def get_first_page_id(self) -> str:
-        """Get the ID of the first page for default display"""
-        if self.sections:
-            return self.sections[0].id
-        return "page-home"
-    
-    def generate_html(self, md_content: str) -> str:
-        """Generate complete HTML document from markdown"""
-        self.parse_markdown(md_content)
-        
-        sidebar_nav = self.generate_sidebar_nav()
-        dropdown_items = self.generate_dropdown_items()
-        content_sections = self.generate_content_sections()
-        first_page_id = self.get_first_page_id()
-        
-        return f'''<!DOCTYPE html>
+# Only short fragments (the kind repeated across sections) are memoized, and
+# only up to a fixed number of them, so the cache stays small next to the
+# streamed output
+_HTML_CACHE_MAX_SOURCE = 2048
+_HTML_CACHE_MAX_ENTRIES = 1024
+
+
+# Static page skeleton. It is split once at import into literal HTML and the
+# names of the fields filled in per build, so iter_html only yields strings.
+_PAGE_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en" class="scroll-smooth">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{self.title}</title>
+    <title>{title}</title>
     <!-- Load Tailwind CSS -->
     <script src="https://cdn.tailwindcss.com"></script>
     <!-- Load Roboto font -->
@@ -451,7 +69,7 @@ class MarkdownToDocsConverter:
     <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
     <link href="https://fonts.googleapis.com/css2?family=Roboto:wght@400;500;700;900&display=swap" rel="stylesheet">
     <!-- Link to external stylesheet -->
-    <link rel="stylesheet" href="{self.css_path}">
+    <link rel="stylesheet" href="{css_path}">
 </head>
 <body class="bg-white text-gray-800 dark:bg-gray-900 dark:text-gray-200 transition-colors duration-200">
 
@@ -470,7 +88,7 @@ class MarkdownToDocsConverter:
             <!-- Logo/Title -->
             <a href="index.html" class="flex items-center space-x-2">
                 <!-- Logo Image -->
-                <img src="{self.logo_path}" alt="Logo" class="w-24 h-16">
+                <img src="{logo_path}" alt="Logo" class="w-24 h-16">
             </a>
         </div>
 
@@ -519,7 +137,7 @@ class MarkdownToDocsConverter:
             </button>
 
             <!-- GitHub Link -->
-            <a href="{self.github_url}" target="_blank" rel="noopener noreferrer" class="text-gray-600 hover:text-purple-600 dark:text-gray-400 dark:hover:text-white" aria-label="GitHub repository">
+            <a href="{github_url}" target="_blank" rel="noopener noreferrer" class="text-gray-600 hover:text-purple-600 dark:text-gray-400 dark:hover:text-white" aria-label="GitHub repository">
                 <svg class="w-6 h-6" fill="currentColor" viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg">
                     <path d="M12 2C6.477 2 2 6.477 2 12c0 4.418 2.865 8.165 6.839 9.489.5.092.682-.217.682-.483 0-.237-.009-.868-.013-1.703-2.782.605-3.369-1.343-3.369-1.343-.454-1.158-1.11-1.466-1.11-1.466-.908-.62.069-.608.069-.608 1.003.07 1.531 1.032 1.531 1.032.892 1.53 2.341 1.088 2.91.832.092-.647.35-1.088.636-1.338-2.22-.253-4.555-1.11-4.555-4.951 0-1.093.39-1.988 1.029-2.688-.103-.253-.446-1.272.098-2.65 0 0 .84-.27 2.75 1.026A9.564 9.564 0 0112 6.84c.85.004 1.705.115 2.504.337 1.909-1.296 2.747-1.026 2.747-1.026.546 1.379.202 2.398.1 2.65.64.7 1.028 1.595 1.028 2.688 0 3.848-2.339 4.695-4.566 4.942.359.309.678.92.678 1.855 0 1.338-.012 2.419-.012 2.747 0 .268.18.58.688.482A10.001 10.001 0 0022 12c0-5.523-4.477-10-10-10z"/>
                 </svg>
@@ -565,39 +183,39 @@ class MarkdownToDocsConverter:
 
     <script>
         // --- Page Navigation ---
-        function showPage(pageId, navId, clickedElement) {{
+        function showPage(pageId, navId, clickedElement) {
             // Hide all page content sections
-            document.querySelectorAll('.page-content').forEach(page => {{
+            document.querySelectorAll('.page-content').forEach(page => {
                 page.classList.add('hidden');
-            }});
+            });
 
             // Show the selected page
             const targetPage = document.getElementById(pageId);
-            if (targetPage) {{
+            if (targetPage) {
                 targetPage.classList.remove('hidden');
-            }}
+            }
 
             // Remove active class from all sidebar links
-            document.querySelectorAll('.sidebar-link').forEach(link => {{
+            document.querySelectorAll('.sidebar-link').forEach(link => {
                 link.classList.remove('sidebar-active');
-            }});
+            });
 
             // Add active class to clicked element
-            if (clickedElement) {{
+            if (clickedElement) {
                 clickedElement.classList.add('sidebar-active');
-            }}
+            }
 
             // Close mobile menu on page navigation
-            if (window.innerWidth < 768) {{
+            if (window.innerWidth < 768) {
                 toggleMobileMenu(false);
-            }}
+            }
 
             // Close dropdowns
             closeAllDropdowns();
-        }}
+        }
 
         // --- Dropdown Menus ---
-        function toggleDropdown(dropdownId) {{
+        function toggleDropdown(dropdownId) {
             const dropdown = document.getElementById(dropdownId);
             const isOpen = !dropdown.classList.contains('hidden');
             
@@ -605,129 +223,813 @@ class MarkdownToDocsConverter:
             closeAllDropdowns();
 
             // If it was closed, open it
-            if (!isOpen) {{
+            if (!isOpen) {
                 dropdown.classList.remove('hidden');
-            }}
-        }}
+            }
+        }
 
-        function closeAllDropdowns() {{
-            document.querySelectorAll('.dropdown-menu').forEach(menu => {{
+        function closeAllDropdowns() {
+            document.querySelectorAll('.dropdown-menu').forEach(menu => {
                 menu.classList.add('hidden');
-            }});
-        }}
+            });
+        }
 
         // Close dropdowns if clicking outside
-        window.addEventListener('click', function(event) {{
-            if (!event.target.closest('[onclick^="toggleDropdown"]')) {{
+        window.addEventListener('click', function(event) {
+            if (!event.target.closest('[onclick^="toggleDropdown"]')) {
                 closeAllDropdowns();
-            }}
-        }});
+            }
+        });
 
         // --- Sidebar Submenu ---
-        function toggleSidebarMenu(submenuId, element) {{
+        function toggleSidebarMenu(submenuId, element) {
             const submenu = document.getElementById(submenuId);
             const chevron = element.querySelector('.submenu-chevron');
-            if (submenu) {{
+            if (submenu) {
                 submenu.classList.toggle('hidden');
                 chevron.classList.toggle('rotate-180');
                 element.setAttribute('aria-expanded', !submenu.classList.contains('hidden'));
-            }}
-        }}
+            }
+        }
 
         // --- Mobile Menu Toggle ---
-        function toggleMobileMenu(forceState) {{
+        function toggleMobileMenu(forceState) {
             const sidebar = document.getElementById('sidebar');
             const overlay = document.getElementById('overlay');
             const mobileMenuBtn = document.getElementById('mobile-menu-btn');
             
             let open;
-            if (typeof forceState === 'boolean') {{
+            if (typeof forceState === 'boolean') {
                 open = forceState;
-            }} else {{
+            } else {
                 open = sidebar.classList.contains('-translate-x-full');
-            }}
+            }
 
-            if (open) {{
+            if (open) {
                 sidebar.classList.remove('-translate-x-full');
                 sidebar.classList.add('translate-x-0');
                 overlay.classList.remove('hidden');
                 mobileMenuBtn.innerHTML = `<svg class="w-6 h-6" fill="none" stroke="currentColor" viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M6 18L18 6M6 6l12 12"></path></svg>`;
-            }} else {{
+            } else {
                 sidebar.classList.add('-translate-x-full');
                 sidebar.classList.remove('translate-x-0');
                 overlay.classList.add('hidden');
                 mobileMenuBtn.innerHTML = `<svg class="w-6 h-6" fill="none" stroke="currentColor" viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M4 6h16M4 12h16M4 18h16"></path></svg>`;
-            }}
-        }}
+            }
+        }
 
         // --- Search Modal ---
-        function showSearchModal(message) {{
+        function showSearchModal(message) {
             document.getElementById('search-modal-message').textContent = message;
             document.getElementById('search-modal').classList.remove('hidden');
-        }}
+        }
 
-        function closeSearchModal() {{
+        function closeSearchModal() {
             document.getElementById('search-modal').classList.add('hidden');
-        }}
+        }
 
-        function handleSearch(event) {{
+        function handleSearch(event) {
             event.preventDefault();
             const input = document.getElementById('search-input');
             const query = input.value.trim();
-            if (query) {{
-                showSearchModal(`Search functionality for "${{query}}" is not implemented yet.`);
-            }} else {{
+            if (query) {
+                showSearchModal(`Search functionality for "${query}" is not implemented yet.`);
+            } else {
                 showSearchModal('Please enter a search term.');
-            }}
-        }}
+            }
+        }
         
         // --- Dark Mode ---
         const themeIconLight = document.getElementById('theme-icon-light');
         const themeIconDark = document.getElementById('theme-icon-dark');
 
-        function toggleDarkMode() {{
-            if (document.documentElement.classList.contains('dark')) {{
+        function toggleDarkMode() {
+            if (document.documentElement.classList.contains('dark')) {
                 document.documentElement.classList.remove('dark');
                 localStorage.setItem('theme', 'light');
                 themeIconLight.classList.remove('hidden');
                 themeIconDark.classList.add('hidden');
-            }} else {{
+            } else {
                 document.documentElement.classList.add('dark');
                 localStorage.setItem('theme', 'dark');
                 themeIconDark.classList.remove('hidden');
                 themeIconLight.classList.add('hidden');
-            }}
-        }}
+            }
+        }
 
         // Check for saved theme preference
-        function applyInitialTheme() {{
+        function applyInitialTheme() {
             const savedTheme = localStorage.getItem('theme');
-            if (savedTheme === 'dark' || (!savedTheme && window.matchMedia('(prefers-color-scheme: dark)').matches)) {{
+            if (savedTheme === 'dark' || (!savedTheme && window.matchMedia('(prefers-color-scheme: dark)').matches)) {
                 document.documentElement.classList.add('dark');
                 themeIconDark.classList.remove('hidden');
-            }} else {{
+            } else {
                 document.documentElement.classList.remove('dark');
                 themeIconLight.classList.remove('hidden');
-            }}
-        }}
+            }
+        }
 
         applyInitialTheme();
 
         // --- Initialize Page ---
         // Show first page by default
-        document.addEventListener('DOMContentLoaded', function() {{
+        document.addEventListener('DOMContentLoaded', function() {
             const firstLink = document.querySelector('.sidebar-link[data-page-id]');
-            if (firstLink) {{
+            if (firstLink) {
                 showPage('{first_page_id}', 'nav-docs', firstLink);
-            }}
-        }});
+            }
+        });
     </script>
 
 </body>
 </html>'''
 
+# Per-build values spliced into _PAGE_TEMPLATE, keyed by field name. Each
+# takes the converter after parse_markdown; content_sections yields its pages
+# one at a time instead of returning a single string.
+_PAGE_FIELDS = {
+    'title': lambda converter: converter.title,
+    'css_path': lambda converter: converter.css_path,
+    'logo_path': lambda converter: converter.logo_path,
+    'dropdown_items': lambda converter: converter.generate_dropdown_items(),
+    'github_url': lambda converter: converter.github_url,
+    'sidebar_nav': lambda converter: converter.generate_sidebar_nav(),
+    'content_sections': lambda converter: converter.generate_content_sections(),
+    'first_page_id': lambda converter: converter.get_first_page_id(),
+}
+_PAGE_PARTS = [
+    (part, index % 2 == 1)
+    for index, part in enumerate(re.split(r'\{(' + '|'.join(_PAGE_FIELDS) + r')\}', _PAGE_TEMPLATE))
+]
 
-def main():
+
+@functools.lru_cache(maxsize=4096)
+def slugify(text: str) -> str:
+    """Convert text to URL-friendly slug"""
+    # Keep word characters, drop other punctuation and collapse runs of
+    # whitespace and hyphens into a single hyphen
+    slug = []
+    in_separator = False
+    for char in text.lower().strip():
+        if char == '-' or char.isspace():
+            if not in_separator:
+                slug.append('-')
+                in_separator = True
+        elif char.isalnum() or char == '_':
+            slug.append(char)
+            in_separator = False
+    return ''.join(slug)
+
+
+# The scanners below walk the text with str.find instead of regex passes.
+# Each one follows the leftmost, non-overlapping match order of re.sub, but
+# skips ahead after a failed match instead of retrying every later opener,
+# so unmatched delimiters cannot make them quadratic.
+
+def _extract_code_blocks(text: str, code_spans: list[tuple]) -> str:
+    """Replace ```lang fenced code blocks with placeholders"""
+    parts = []
+    pos = 0
+    start = text.find('```')
+    while start != -1:
+        # Optional language word, then a newline before the code
+        lang_end = start + 3
+        while lang_end < len(text) and (text[lang_end].isalnum() or text[lang_end] == '_'):
+            lang_end += 1
+        if not text.startswith('\n', lang_end):
+            start = text.find('```', start + 1)
+            continue
+        
+        end = text.find('```', lang_end + 1)
+        if end == -1:
+            break
+        
+        lang = text[start + 3:lang_end] or 'text'
+        parts.append(text[pos:start])
+        parts.append(f"{_CODE_PLACEHOLDER}{len(code_spans)}___")
+        code_spans.append((lang, text[lang_end + 1:end].strip()))
+        pos = end + 3
+        start = text.find('```', pos)
+    
+    parts.append(text[pos:])
+    return ''.join(parts)
+
+
+def _extract_inline_code(text: str, code_spans: list[tuple]) -> str:
+    """Replace `inline code` spans with placeholders"""
+    parts = []
+    pos = 0
+    start = text.find('`')
+    while start != -1:
+        end = text.find('`', start + 1)
+        if end == -1:
+            break
+        if end == start + 1:
+            # Empty span: the second backtick may open the next one
+            start = end
+            continue
+        
+        parts.append(text[pos:start])
+        parts.append(f"{_CODE_PLACEHOLDER}{len(code_spans)}___")
+        code_spans.append((None, text[start + 1:end]))
+        pos = end + 1
+        start = text.find('`', pos)
+    
+    parts.append(text[pos:])
+    return ''.join(parts)
+
+
+def _wrap_delimited(text: str, marker: str, tag: str) -> str:
+    """Wrap non-empty single-line spans enclosed by marker in an HTML tag"""
+    parts = []
+    pos = 0
+    size = len(marker)
+    start = text.find(marker)
+    while start != -1:
+        line_end = text.find('\n', start)
+        if line_end == -1:
+            line_end = len(text)
+        end = text.find(marker, start + size + 1, line_end)
+        if end == -1:
+            # No later opener on this line can be closed either
+            start = text.find(marker, line_end)
+            continue
+        
+        parts.append(text[pos:start])
+        parts.append(f'<{tag}>{text[start + size:end]}</{tag}>')
+        pos = end + size
+        start = text.find(marker, pos)
+    
+    parts.append(text[pos:])
+    return ''.join(parts)
+
+
+def _convert_links(text: str) -> str:
+    """Convert [text](url) links to anchors"""
+    parts = []
+    pos = 0
+    start = text.find('[')
+    while start != -1:
+        close = text.find(']', start + 1)
+        if close == -1:
+            break
+        if close > start + 1 and text.startswith('(', close + 1):
+            end = text.find(')', close + 2)
+            if end == -1:
+                break
+            if end > close + 2:
+                parts.append(text[pos:start])
+                parts.append(_LINK_TEMPLATE.format(text[close + 2:end], text[start + 1:close]))
+                pos = end + 1
+                start = text.find('[', pos)
+                continue
+        # Openers before this ']' would fail the same way
+        start = text.find('[', close + 1)
+    
+    parts.append(text[pos:])
+    return ''.join(parts)
+
+
+def _render_code(code_spans: list[tuple]) -> list[str]:
+    """Escape and style extracted code (inline spans have no language)"""
+    # Escape everything in one call; the NUL separator is only safe to split
+    # on if the code itself contains none
+    sources = [code for _, code in code_spans]
+    joined = '\0'.join(sources)
+    if sources and joined.count('\0') == len(sources) - 1:
+        escaped = html.escape(joined).split('\0')
+    else:
+        escaped = [html.escape(code) for code in sources]
+    
+    return [
+        f'<code>{code}</code>' if lang is None else f'''<pre data-language="{lang}">
+<code class="language-{lang}">{code}</code>
+</pre>'''
+        for (lang, _), code in zip(code_spans, escaped)
+    ]
+
+
+def _is_table_separator(row: str) -> bool:
+    """Check for a |---|:---:| row (row is already stripped)"""
+    if len(row) < 3 or not row.startswith('|') or not row.endswith('|'):
+        return False
+    return not row[1:-1].replace('-', '').replace(':', '').replace('|', '').strip()
+
+
+def _restore_code(text: str, code_html: list[str]) -> str:
+    """Swap code placeholders back for their rendered HTML"""
+    parts = []
+    pos = 0
+    size = len(_CODE_PLACEHOLDER)
+    start = text.find(_CODE_PLACEHOLDER)
+    while start != -1:
+        end = text.find('___', start + size)
+        index = text[start + size:end]
+        if end == -1 or not index.isdecimal() or int(index) >= len(code_html):
+            start = text.find(_CODE_PLACEHOLDER, start + 1)
+            continue
+        
+        parts.append(text[pos:start])
+        parts.append(code_html[int(index)])
+        pos = end + 3
+        start = text.find(_CODE_PLACEHOLDER, pos)
+    
+    parts.append(text[pos:])
+    return ''.join(parts)
+
+
+@dataclass
+class Section:
+    """Represents a documentation section"""
+    id: str
+    title: str
+    level: int
+    content: str = ""
+    children: list = field(default_factory=list)
+    parent_id: Optional[str] = None
+
+
+class MarkdownToDocsConverter:
+    def __init__(self, title: str = "Documentation", logo_path: str = "images/logo.svg",
+                 css_path: str = "css/style.css", github_url: str = "#"):
+        self.title = title
+        self.logo_path = logo_path
+        self.css_path = css_path
+        self.github_url = github_url
+        self.sections: list[Section] = []
+        # Rendered HTML of short fragments keyed by markdown source, so
+        # repeated content is converted once; emptied after each page
+        self._html_cache: dict[str, str] = {}
+        
+    def parse_markdown(self, md_content: str) -> list[Section]:
+        """Parse markdown content into sections"""
+        # Prefix a newline so the first line is matched like every other one
+        text = '\n' + md_content
+        sections = []
+        current_h1: Optional[Section] = None
+        current_section: Optional[Section] = None
+        content_start = 0
+        in_code_block = False
+        
+        def save_content(content_end: int):
+            if current_section:
+                current_section.content = text[content_start:content_end]
+        
+        # One scan over the whole document finds every fence and h1/h2 line;
+        # section content is sliced out between the matched heading lines
+        for match in _RE_SECTION_SPLIT.finditer(text):
+            # Track code blocks to avoid matching # inside them
+            if match.lastgroup == 'fence':
+                in_code_block = not in_code_block
+                continue
+            
+            # Skip heading detection inside code blocks
+            if in_code_block:
+                continue
+            
+            # Level 1 heading
+            if match.lastgroup == 'h1':
+                save_content(match.start())
+                title = match.group('h1').strip()
+                section_id = f"page-{slugify(title)}"
+                current_h1 = Section(id=section_id, title=title, level=1)
+                current_section = current_h1
+                sections.append(current_h1)
+                content_start = match.end() + 1
+                continue
+            
+            # Level 2 heading
+            if current_h1:
+                save_content(match.start())
+                title = match.group('h2').strip()
+                section_id = f"page-{slugify(current_h1.title)}-{slugify(title)}"
+                h2_section = Section(
+                    id=section_id, 
+                    title=title, 
+                    level=2, 
+                    parent_id=current_h1.id
+                )
+                current_h1.children.append(h2_section)
+                current_section = h2_section
+                content_start = match.end() + 1
+        
+        # Save remaining content
+        save_content(len(text))
+        
+        self.sections = sections
+        return sections
+    
+    def convert_markdown_to_html(self, md_content: str) -> str:
+        """Convert markdown content to HTML"""
+        cached_html = self._html_cache.get(md_content)
+        if cached_html is not None:
+            return cached_html
+        
+        # Convert code blocks first (preserve them)
+        # Code is replaced by a placeholder as it is extracted, so the
+        # conversions below never see it
+        code_spans = []
+        html_content = _extract_code_blocks(md_content, code_spans)
+        
+        # Inline code
+        html_content = _extract_inline_code(html_content, code_spans)
+        
+        # Convert bold
+        html_content = _wrap_delimited(html_content, '**', 'strong')
+        
+        # Convert italic
+        html_content = _wrap_delimited(html_content, '*', 'em')
+        
+        # Convert links
+        html_content = _convert_links(html_content)
+        
+        # Convert tables, lists and paragraphs in a single pass over the lines
+        lines = html_content.split('\n')
+        result_lines = []
+        in_table = False
+        is_header_row = False
+        list_items = []
+        list_type = None  # 'ul' or 'ol'
+        
+        for index, line in enumerate(lines):
+            stripped = line.strip()
+            
+            # Stream table rows; a table needs at least two consecutive rows
+            if stripped.startswith('|'):
+                if list_items:
+                    result_lines.append(self._create_list(list_items, list_type))
+                    list_items = []
+                    list_type = None
+                
+                if not in_table:
+                    next_line = lines[index + 1] if index + 1 < len(lines) else ''
+                    if not next_line.strip().startswith('|'):
+                        result_lines.append(line)
+                        continue
+                    in_table = True
+                    is_header_row = True
+                    result_lines.append('<div class="overflow-x-auto mb-6">')
+                    result_lines.append('<table class="min-w-full divide-y divide-gray-200 dark:divide-gray-700">')
+                
+                # Skip separator line (------|----)
+                if not _is_table_separator(stripped):
+                    result_lines.append(self._create_table_row(line, is_header_row))
+                is_header_row = False
+                continue
+            
+            if in_table:
+                result_lines.append(_TABLE_CLOSE)
+                in_table = False
+            
+            # Collect list items until the list ends or changes type
+            # (the first character rules out most lines before any regex runs)
+            first_char = stripped[:1]
+            list_match = None
+            if first_char in ('-', '*'):
+                item_type = 'ul'
+                list_match = _RE_UL_ITEM.match(line)
+            elif first_char.isdecimal():
+                item_type = 'ol'
+                list_match = _RE_OL_ITEM.match(line)
+            if list_match:
+                if list_type != item_type and list_items:
+                    result_lines.append(self._create_list(list_items, list_type))
+                    list_items = []
+                list_type = item_type
+                list_items.append(list_match.group(2))
+                continue
+            
+            if list_items:
+                result_lines.append(self._create_list(list_items, list_type))
+                list_items = []
+                list_type = None
+            
+            # Keep empty lines
+            if not stripped:
+                result_lines.append('')
+                continue
+            
+            # Convert headings (h3, h4 - h1 and h2 are handled as sections)
+            if line.startswith('###'):
+                level = 4 if line.startswith('####') else 3
+                title = line[level:].lstrip()
+                if title and line[level].isspace():
+                    result_lines.append(_HEADING_TEMPLATES[level].format(title))
+                    continue
+            
+            # Convert horizontal rules
+            if line.startswith('---') and not line.strip('-'):
+                result_lines.append('<hr />')
+                continue
+            
+            # Skip lines that are already HTML tags or special markers; most
+            # prose is ruled out by its first character alone
+            if first_char in _PASSTHROUGH_FIRST_CHARS and (
+                    first_char == '<' or
+                    first_char == '_' and stripped.startswith('___') or
+                    first_char == '-' and stripped[1:2] == ' '):
+                result_lines.append(line)
+                continue
+            
+            # Wrap plain text in paragraph tags
+            result_lines.append(f'<p class="text-lg text-gray-700 leading-relaxed mb-4 dark:text-gray-300">{stripped}</p>')
+        
+        # Handle a table or list at end of content
+        if in_table:
+            result_lines.append(_TABLE_CLOSE)
+        if list_items:
+            result_lines.append(self._create_list(list_items, list_type))
+        
+        html_content = '\n'.join(result_lines)
+        
+        # Restore code blocks and inline code with styling
+        html_content = _restore_code(html_content, _render_code(code_spans))
+        
+        if len(md_content) <= _HTML_CACHE_MAX_SOURCE and len(self._html_cache) < _HTML_CACHE_MAX_ENTRIES:
+            self._html_cache[md_content] = html_content
+        return html_content
+    
+    def _create_table_row(self, line: str, header: bool) -> str:
+        """Create HTML for one markdown table row"""
+        cells = [cell.strip() for cell in line.strip('|').split('|')]
+        
+        if header:
+            html_row = ['<thead class="bg-gray-50 dark:bg-gray-800">', '<tr>']
+            for cell in cells:
+                html_row.append(f'<th class="px-4 py-3 text-left text-xs font-medium text-gray-500 uppercase tracking-wider dark:text-gray-400">{cell}</th>')
+            html_row.append('</tr>')
+            html_row.append('</thead>')
+            html_row.append('<tbody class="bg-white divide-y divide-gray-200 dark:bg-gray-900 dark:divide-gray-700">')
+        else:
+            html_row = ['<tr>']
+            for cell in cells:
+                html_row.append(f'<td class="px-4 py-3 text-sm text-gray-700 dark:text-gray-300">{cell}</td>')
+            html_row.append('</tr>')
+        
+        return '\n'.join(html_row)
+    
+    def _create_list(self, items: list[str], list_type: str) -> str:
+        """Create HTML list from items"""
+        tag = list_type or 'ul'
+        list_class = "list-disc" if tag == 'ul' else "list-decimal"
+        html_list = [f'<{tag} class="{list_class} list-inside space-y-2 mb-4 text-gray-700 dark:text-gray-300">']
+        for item in items:
+            html_list.append(f'<li>{item}</li>')
+        html_list.append(f'</{tag}>')
+        return '\n'.join(html_list)
+    
+    def generate_sidebar_nav(self) -> str:
+        """Generate sidebar navigation HTML"""
+        nav_items = []
+        
+        for section in self.sections:
+            if section.children:
+                # Section with subsections - create collapsible menu
+                submenu_id = f"submenu-{slugify(section.title)}"
+                children_html = '\n'.join(f'''
+                                    <a href="#" class="sidebar-link group flex items-center px-3 py-2 text-sm font-medium rounded-md text-gray-600 hover:text-gray-900 hover:bg-gray-100 dark:text-gray-400 dark:hover:bg-gray-700 dark:hover:text-white" data-page-id="{child.id}" onclick="showPage('{child.id}', 'nav-docs', this)">
+                                        {child.title}
+                                    </a>''' for child in section.children)
+                nav_items.append(f'''
+                            <!-- Collapsible {section.title} Menu -->
+                            <div>
+                                <button onclick="toggleSidebarMenu('{submenu_id}', this)" class="sidebar-link group w-full flex items-center justify-between px-3 py-2 text-base font-medium rounded-md text-gray-700 hover:text-gray-900 hover:bg-gray-100 dark:text-gray-300 dark:hover:bg-gray-700 dark:hover:text-white" aria-expanded="false">
+                                    <span>{section.title}</span>
+                                    <svg class="submenu-chevron w-5 h-5 transform transition-transform duration-200" fill="currentColor" viewBox="0 0 20 20" xmlns="http://www.w3.org/2000/svg"><path fill-rule="evenodd" d="M5.293 7.293a1 1 0 011.414 0L10 10.586l3.293-3.293a1 1 0 111.414 1.414l-4 4a1 1 0 01-1.414 0l-4-4a1 1 0 010-1.414z" clip-rule="evenodd"></path></svg>
+                                </button>
+                                <div id="{submenu_id}" class="hidden mt-1 space-y-1 pl-4 border-l-2 border-gray-200 ml-3 dark:border-gray-600">
+{children_html}
+
+                                </div>
+                            </div>''')
+            else:
+                # Simple section without subsections
+                nav_items.append(f'''
+                            <a href="#" class="sidebar-link group flex items-center px-3 py-2 text-base font-medium rounded-md text-gray-700 hover:text-gray-900 hover:bg-gray-100 dark:text-gray-300 dark:hover:bg-gray-700 dark:hover:text-white" data-page-id="{section.id}" onclick="showPage('{section.id}', 'nav-docs', this)">
+                                {section.title}
+                            </a>''')
+        
+        return '\n'.join(nav_items)
+    
+    def generate_dropdown_items(self) -> str:
+        """Generate dropdown menu items for top navigation"""
+        items = []
+        for section in self.sections:
+            items.append(f'''                    <a href="#" class="block px-4 py-2 text-sm text-gray-700 hover:bg-gray-100 dark:text-gray-300 dark:hover:bg-gray-700" onclick="showPage('{section.id}', 'nav-docs', this)" data-page-id="{section.id}">{section.title}</a>''')
+        return '\n'.join(items)
+    
+    def generate_content_sections(self) -> Iterator[str]:
+        """Generate content sections HTML, one top-level section at a time"""
+        for index, section in enumerate(self.sections):
+            # Convert section content
+            content_html = self.convert_markdown_to_html(section.content)
+            
+            # Child content is rendered once and used both inline and on the
+            # child's own page
+            child_contents_html = [self.convert_markdown_to_html(child.content) for child in section.children]
+            
+            # Add child sections
+            children_html = ''.join(f'''
+                    
+                    <section id="{child.id}-content" class="mt-10">
+                        <h2 class="text-2xl font-semibold mt-8 mb-4 dark:text-white">{child.title}</h2>
+                        {child_content_html}
+                    </section>''' for child, child_content_html in zip(section.children, child_contents_html))
+            
+            section_pages = [f'''
+                <!-- Page: {section.title} -->
+                <section id="{section.id}" class="page-content hidden">
+                    <h1 class="text-4xl font-bold mb-6 pb-2 border-b border-gray-200 text-gray-900 dark:text-white dark:border-gray-700">{section.title}</h1>
+                    {content_html}{children_html}
+                </section>''']
+            
+            # Also create separate pages for child sections if they should be standalone
+            section_pages.extend(f'''
+                <!-- Page: {child.title} -->
+                <section id="{child.id}" class="page-content hidden">
+                    <h1 class="text-4xl font-bold mb-6 pb-2 border-b border-gray-200 text-gray-900 dark:text-white dark:border-gray-700">{child.title}</h1>
+                    {child_content_html}
+                </section>''' for child, child_content_html in zip(section.children, child_contents_html))
+            
+            if index:
+                yield '\n'
+            yield '\n'.join(section_pages)
+    
+    def get_first_page_id(self) -> str:
+        """Get the ID of the first page for default display"""
+        if self.sections:
+            return self.sections[0].id
+        return "page-home"
+    
+    def iter_html(self, md_content: str) -> Iterator[str]:
+        """Generate the complete HTML document from markdown as a series of chunks"""
+        self.parse_markdown(md_content)
+        
+        # Page content is yielded section by section as it is rendered, so
+        # the full document never has to exist as one string
+        try:
+            for part, is_field in _PAGE_PARTS:
+                if not is_field:
+                    yield part
+                    continue
+                value = _PAGE_FIELDS[part](self)
+                if isinstance(value, str):
+                    yield value
+                else:
+                    yield from value
+        finally:
+            self._html_cache.clear()
+    
+    def generate_html(self, md_content: str, out: TextIO) -> None:
+        """Write complete HTML document generated from markdown to out"""
+        out.writelines(self.iter_html(md_content))
+
+
+def _default_cache_dir() -> Optional[Path]:
+    """Directory for cached pages, following XDG_CACHE_HOME when set.
+    
+    Returns None, disabling the cache, when there is no XDG_CACHE_HOME and
+    no home directory can be determined.
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME')
+    if cache_home:
+        return Path(cache_home) / 'lipid-docs'
+    try:
+        return Path.home() / '.cache' / 'lipid-docs'
+    except (RuntimeError, KeyError):
+        return None
+
+
+# Cached pages not reused for this long are removed whenever a page is stored
+_CACHE_MAX_AGE_DAYS = 30
+
+
+def _prune_cache(cache_dir: Path) -> None:
+    """Remove cached pages (and stray temporary files) older than the age limit"""
+    cutoff = time.time() - _CACHE_MAX_AGE_DAYS * 24 * 60 * 60
+    for entry in cache_dir.iterdir():
+        if entry.suffix not in ('.html', '.tmp'):
+            continue
+        try:
+            if entry.stat().st_mtime < cutoff:
+                entry.unlink()
+        except OSError:
+            pass
+
+
+# Each cache entry starts with a digest of the page that follows it, so an
+# entry truncated or altered outside the converter is re-rendered, not served
+_CACHE_DIGEST_SIZE = 16
+
+
+def _read_cached_page(cache_path: Path) -> Optional[bytes]:
+    """Page stored in a cache entry, or None if the entry fails its digest check"""
+    entry = cache_path.read_bytes()
+    digest, page = entry[:_CACHE_DIGEST_SIZE], entry[_CACHE_DIGEST_SIZE:]
+    if hashlib.blake2b(page, digest_size=_CACHE_DIGEST_SIZE).digest() != digest:
+        return None
+    return page
+
+
+@functools.lru_cache(maxsize=1)
+def _source_digest() -> bytes:
+    """Digest of this script, so cached pages are dropped when the converter changes"""
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).digest()
+
+
+def _section_titles(converter: MarkdownToDocsConverter) -> list[tuple[str, list[str]]]:
+    """Titles of the parsed sections and their children, for reporting"""
+    return [(section.title, [child.title for child in section.children]) for section in converter.sections]
+
+
+def _convert_one(input_path: Path, output_path: Path, title: str, logo_path: str,
+                 css_path: str, github_url: str,
+                 cache_dir: Optional[Path] = None) -> list[tuple[str, list[str]]]:
+    """Convert one Markdown file to a documentation page.
+    
+    Kept at module level so it can run in a worker process; returns the
+    section titles for main to report. When cache_dir is given, pages are
+    looked up there by a hash of the Markdown bytes, the page options and
+    this script, and only rendered on a miss.
+    """
+    md_bytes = input_path.read_bytes()
+    # Decode the whole file at once; text mode would also have translated
+    # \r\n and \r line endings, so do that here
+    md_content = md_bytes.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+    
+    converter = MarkdownToDocsConverter(
+        title=title,
+        logo_path=logo_path,
+        css_path=css_path,
+        github_url=github_url
+    )
+    
+    cache_path = None
+    if cache_dir is not None:
+        key = hashlib.blake2b(md_bytes, digest_size=16)
+        key.update(repr((title, logo_path, css_path, github_url)).encode('utf-8'))
+        key.update(_source_digest())
+        cache_path = cache_dir / f'{key.hexdigest()}.html'
+        try:
+            page = _read_cached_page(cache_path)
+            if page is not None:
+                output_path.write_bytes(page)
+        except OSError:
+            # Missing, unreadable or just removed: render the page instead
+            page = None
+        if page is not None:
+            # Mark the entry as used so pruning keeps it
+            try:
+                os.utime(cache_path)
+            except OSError:
+                pass
+            # Parsing is cheap and still needed for the section summary
+            converter.parse_markdown(md_content)
+            return _section_titles(converter)
+    
+    # Convert straight into the output file
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        for chunk in converter.iter_html(md_content):
+            f.write(chunk)
+    
+    if cache_path is not None:
+        # The cache is best effort: a failed store must not fail the build.
+        # Write under a temporary name so parallel workers never see a
+        # partial page.
+        temp_path = cache_path.with_name(f'{cache_path.stem}.{os.getpid()}.tmp')
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            page = output_path.read_bytes()
+            temp_path.write_bytes(hashlib.blake2b(page, digest_size=_CACHE_DIGEST_SIZE).digest() + page)
+            os.replace(temp_path, cache_path)
+            _prune_cache(cache_dir)
+        except OSError:
+            pass
+    
+    return _section_titles(converter)
+
+
+@dataclass
+class _CliArgs:
+    """Command line options; the defaults are shared with the argparse parser"""
+    input: list[str]
+    output: Optional[str] = None
+    title: str = 'LIPID+ - Documentation'
+    logo: str = 'images/logo.svg'
+    css: str = 'css/style.css'
+    github: str = 'https://github.com/pluskal-lab/DreaMS'
+    no_cache: bool = False
+
+
+def _parse_args(argv: list[str]) -> _CliArgs:
+    """Parse command line options, skipping argparse for a bare input file"""
+    # The common build step is one input file with default options; it
+    # needs neither the argparse import nor the parser construction
+    if len(argv) == 1 and not argv[0].startswith('-'):
+        return _CliArgs(input=argv)
+    
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='Convert Markdown to Documentation HTML',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -736,52 +1038,91 @@ Example usage:
   python md_to_docs.py TUTORIAL.md -o docs.html
   python md_to_docs.py TUTORIAL.md -o docs.html --title "LIPID+ Documentation"
   python md_to_docs.py TUTORIAL.md -o docs.html --logo images/logo.svg --github https://github.com/user/repo
+  python md_to_docs.py docs/*.md -o site/
         '''
     )
     
-    parser.add_argument('input', help='Input Markdown file path')
-    parser.add_argument('-o', '--output', default='docs.html', help='Output HTML file path (default: docs.html)')
-    parser.add_argument('--title', default='LIPID+ - Documentation', help='Page title')
-    parser.add_argument('--logo', default='images/logo.svg', help='Path to logo image')
-    parser.add_argument('--css', default='css/style.css', help='Path to CSS file')
-    parser.add_argument('--github', default='https://github.com/pluskal-lab/DreaMS', help='GitHub repository URL')
-    
-    args = parser.parse_args()
+    parser.add_argument('input', nargs='+', help='Input Markdown file path(s)')
+    parser.add_argument('-o', '--output', default=None,
+                        help='Output HTML file path for a single input (default: docs.html), '
+                             'or output directory for several inputs (default: .)')
+    parser.add_argument('--title', default=_CliArgs.title, help='Page title')
+    parser.add_argument('--logo', default=_CliArgs.logo, help='Path to logo image')
+    parser.add_argument('--css', default=_CliArgs.css, help='Path to CSS file')
+    parser.add_argument('--github', default=_CliArgs.github, help='GitHub repository URL')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always re-render instead of reusing pages cached in $XDG_CACHE_HOME/lipid-docs '
+                             f'(or ~/.cache/lipid-docs; entries unused for {_CACHE_MAX_AGE_DAYS} days are removed)')
     
-    # Read input file
-    input_path = Path(args.input)
-    if not input_path.exists():
-        print(f"Error: Input file '{args.input}' not found")
-        return 1
+    return _CliArgs(**vars(parser.parse_args(argv)))
+
+
+def main():
+    args = _parse_args(sys.argv[1:])
     
-    with open(input_path, 'r', encoding='utf-8') as f:
-        md_content = f.read()
+    # Check input files
+    input_paths = [Path(name) for name in args.input]
+    for name, input_path in zip(args.input, input_paths):
+        if not input_path.exists():
+            print(f"Error: Input file '{name}' not found")
+            return 1
     
-    # Convert
-    converter = MarkdownToDocsConverter(
-        title=args.title,
-        logo_path=args.logo,
-        css_path=args.css,
-        github_url=args.github
-    )
+    # A single input is written to the output file; several inputs are
+    # written as <stem>.html into the output directory
+    if len(input_paths) == 1:
+        output_dir = None
+        output_paths = [Path(args.output or 'docs.html')]
+    else:
+        output_dir = Path(args.output or '.')
+        output_paths = [output_dir / f'{input_path.stem}.html' for input_path in input_paths]
     
-    html_content = converter.generate_html(md_content)
+    # Refuse to write a page over one of the inputs, or two pages (inputs
+    # sharing a file name) to the same file
+    names_by_path = {input_path.resolve(): name for name, input_path in zip(args.input, input_paths)}
+    names_by_output: dict[Path, str] = {}
+    for name, output_path in zip(args.input, output_paths):
+        resolved_output = output_path.resolve()
+        if resolved_output in names_by_path:
+            print(f"Error: Output file '{output_path}' would overwrite input file "
+                  f"'{names_by_path[resolved_output]}'")
+            return 1
+        if resolved_output in names_by_output:
+            print(f"Error: Input files '{names_by_output[resolved_output]}' and '{name}' "
+                  f"would both be written to '{output_path}'")
+            return 1
+        names_by_output[resolved_output] = name
     
-    # Write output
-    output_path = Path(args.output)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    if output_dir is not None:
+        try:
+            output_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            print(f"Error: Cannot create output directory '{output_dir}': {e}")
+            return 1
     
-    print(f"Successfully converted '{args.input}' to '{args.output}'")
-    print(f"Found {len(converter.sections)} main sections")
+    convert = functools.partial(_convert_one, title=args.title, logo_path=args.logo,
+                                css_path=args.css, github_url=args.github,
+                                cache_dir=None if args.no_cache else _default_cache_dir())
+    if len(input_paths) == 1:
+        summaries = [convert(input_paths[0], output_paths[0])]
+    else:
+        # Conversion is pure Python, so fan files out to worker processes
+        workers = min(len(input_paths), os.cpu_count() or 1)
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            summaries = list(executor.map(convert, input_paths, output_paths,
+                                          chunksize=max(1, len(input_paths) // (workers * 4))))
     
-    for section in converter.sections:
-        print(f"  - {section.title}")
-        for child in section.children:
-            print(f"      - {child.title}")
+    report = []
+    for name, output_path, sections in zip(args.input, output_paths, summaries):
+        report.append(f"Successfully converted '{name}' to '{output_path}'")
+        report.append(f"Found {len(sections)} main sections")
+        
+        for section_title, child_titles in sections:
+            report.append(f"  - {section_title}")
+            report.extend(f"      - {child_title}" for child_title in child_titles)
+    print('\n'.join(report))
     
     return 0
 
-
 if __name__ == '__main__':
     exit(main())